@@ -1,6 +1,12 @@
 #!/usr/bin/env python3
 """Calculate WER (word error rate) from a TSV file with alignment visualization.
 
+Rows are normalized in bulk, then scored in chunks across worker processes;
+each worker makes a single batched jiwer.process_words call so the edit
+distance runs in jiwer's RapidFuzz backend rather than a per-row Python loop.
+Aggregate hit/substitution/insertion/deletion counts come straight from the
+batched results.
+
 Usage:
     python scripts/calc_wer.py --tsvfile assemblyai_transcripts.tsv --outputfile assemblyai_wer.txt
 """
@@ -9,6 +15,7 @@ import argparse
 import csv
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
 import jiwer
 
@@ -16,18 +23,136 @@ import jiwer
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from normalizer.basic import BasicTextNormalizer
 
+# Curly quotes, dashes, and ellipsis stripped by the "None" normalizer.
+# Built once at import so the table isn't rebuilt per row.
+_PUNCT_TABLE = str.maketrans("", "", "“”„‘’—–…")
+
+def _tn_none(s: str) -> str:
+    """Minimal normalizer for --text_normalizer None: strip smart punctuation.
+
+    All characters in _PUNCT_TABLE are non-ASCII, so pure-ASCII input (the
+    common case for English transcripts) skips the translate pass entirely.
+    """
+    if s.isascii():
+        return s.replace("...", "")
+    return s.translate(_PUNCT_TABLE).replace("...", "")
+
+
+# Rows per worker task; jiwer's edit distance is CPU-bound and releases no
+# GIL, so chunks are scored in separate processes.
+_CHUNK_SIZE = 64
+
+
+def _visualize(
+    ref_words: list[str], hyp_words: list[str], alignment: list
+) -> list[str]:
+    """Build jiwer-style REF/HYP/operation lines from an alignment.
+
+    Byte-for-byte equivalent to one sentence block of
+    jiwer.visualize_alignment (words and operation letters right-justified,
+    one trailing space stripped per line), without building and re-splitting
+    the full multi-sentence string.
+    """
+    ref_parts = []
+    hyp_parts = []
+    op_parts = []
+
+    for chunk in alignment:
+        if chunk.type == "insert":
+            for word in hyp_words[chunk.hyp_start_idx : chunk.hyp_end_idx]:
+                ref_parts.append("*" * len(word))
+                hyp_parts.append(word)
+                op_parts.append("I".rjust(len(word)))
+        elif chunk.type == "delete":
+            for word in ref_words[chunk.ref_start_idx : chunk.ref_end_idx]:
+                ref_parts.append(word)
+                hyp_parts.append("*" * len(word))
+                op_parts.append("D".rjust(len(word)))
+        else:
+            op = " " if chunk.type == "equal" else "S"
+            for ref_word, hyp_word in zip(
+                ref_words[chunk.ref_start_idx : chunk.ref_end_idx],
+                hyp_words[chunk.hyp_start_idx : chunk.hyp_end_idx],
+                strict=True,
+            ):
+                width = max(len(ref_word), len(hyp_word))
+                ref_parts.append(ref_word.rjust(width))
+                hyp_parts.append(hyp_word.rjust(width))
+                op_parts.append(op.rjust(width))
+
+    return [
+        "REF: " + " ".join(ref_parts),
+        "HYP: " + " ".join(hyp_parts),
+        "     " + " ".join(op_parts),
+    ]
+
+
+def _score_chunk(
+    chunk: tuple[list[str], list[str], list[str]],
+) -> tuple[int, int, int, int, list[str]]:
+    """Score one chunk of (file_paths, refs, hyps) with a single batched jiwer call.
+
+    Returns aggregate (hits, substitutions, insertions, deletions) for the
+    chunk plus the per-row visualization strings, in input order.
+    """
+    file_paths, refs, hyps = chunk
+
+    result = jiwer.process_words(refs, hyps)
+
+    visualizations = []
+
+    for file_path, ref_words, hyp_words, alignment in zip(
+        file_paths, result.references, result.hypotheses, result.alignments, strict=True
+    ):
+        # Per-sentence counts from the alignment chunks
+        hits = subs = ins = dels = 0
+        for achunk in alignment:
+            nwords = (
+                achunk.hyp_end_idx - achunk.hyp_start_idx
+                if achunk.type == "insert"
+                else achunk.ref_end_idx - achunk.ref_start_idx
+            )
+            if achunk.type == "equal":
+                hits += nwords
+            elif achunk.type == "substitute":
+                subs += nwords
+            elif achunk.type == "insert":
+                ins += nwords
+            else:
+                dels += nwords
+
+        row_wcount = hits + subs + dels
+        row_wer = float(subs + ins + dels) / row_wcount if row_wcount > 0 else 0.0
+
+        # Blank line after the WER line matches what survives of jiwer's
+        # "=== SENTENCE n ===" header in the original per-row output
+        vis = [
+            file_path,
+            f"WER: {row_wer * 100:.1f}%",
+            "",
+        ] + _visualize(ref_words, hyp_words, alignment) + [""]
+
+        visualizations.append("\n".join(vis))
+
+    return (
+        result.hits,
+        result.substitutions,
+        result.insertions,
+        result.deletions,
+        visualizations,
+    )
+
 
-def read_tsv(path: str) -> tuple[list[str], list[list[str]]]:
-    """Read a TSV file and return (header, rows)."""
+def read_tsv(path: str):
+    """Yield rows from a TSV file, starting with the header row."""
     with open(path, newline="", encoding="utf-8") as f:
         reader = csv.reader(f, delimiter="\t")
-        header = next(reader)
-        data = list(reader)
-    return header, data
+        yield from reader
 
 
 def main(args: argparse.Namespace) -> None:
-    header, data = read_tsv(args.tsvfile)
+    rows = read_tsv(args.tsvfile)
+    header = next(rows)
 
     # Set up text normalizer
     if args.text_normalizer == "Whisper":
@@ -36,56 +161,66 @@ def main(args: argparse.Namespace) -> None:
         from normalizer.english import EnglishTextNormalizer
         tn = EnglishTextNormalizer()
     elif args.text_normalizer == "None":
-        tn = lambda s: s.translate(str.maketrans("", "", "\u201c\u201d\u201e\u2018\u2019\u2014\u2013\u2026")).replace("...", "")
+        tn = _tn_none
     else:
         raise ValueError(f"Unknown text normalizer option: {args.text_normalizer}")
 
-    # Resolve column indices
-    cols = ["file_path", "target", args.hypothesis_column_name]
-    indices = [header.index(c) for c in cols]
+    # Resolve column indices once, up front
+    file_i, tgt_i, hyp_i = (
+        header.index(c) for c in ("file_path", "target", args.hypothesis_column_name)
+    )
+
+    # Stream rows, keeping only the columns we need: the batched jiwer call
+    # requires the normalized texts in memory, but the raw rows do not have
+    # to be retained alongside them.
+    file_paths = []
+    raw_refs = []
+    raw_hyps = []
+    for row in rows:
+        file_paths.append(row[file_i])
+        raw_refs.append(row[tgt_i])
+        raw_hyps.append(row[hyp_i])
+
+    # Normalize each column in a single map pass; the normalizer's regexes
+    # are compiled once at construction, so this is one C-level loop per
+    # column instead of interleaved per-row calls.
+    refs = list(map(tn, raw_refs))
+    hyps = list(map(tn, raw_hyps))
+    del raw_refs, raw_hyps
+
+    # Score chunks of rows in parallel; each worker makes one batched jiwer
+    # call over its chunk. ex.map preserves input order.
+    chunks = [
+        (file_paths[i : i + _CHUNK_SIZE], refs[i : i + _CHUNK_SIZE], hyps[i : i + _CHUNK_SIZE])
+        for i in range(0, len(refs), _CHUNK_SIZE)
+    ]
 
-    # Accumulators for aggregate WER
     ncor = 0
     nsub = 0
     nins = 0
     ndel = 0
 
-    output_str = []
-
-    for row in data:
-        values = {c: row[i] for c, i in zip(cols, indices)}
-
-        ref = tn(values["target"])
-        hyp = tn(values[args.hypothesis_column_name])
-
-        result = jiwer.process_words(ref, hyp)
-
-        ncor += result.hits
-        nsub += result.substitutions
-        nins += result.insertions
-        ndel += result.deletions
-
-        vis = jiwer.visualize_alignment(result, show_measures=False, skip_correct=False)
-        vis = vis.splitlines()
-        vis = vis[1:]  # remove "sentence 1" header
-        vis = [
-            values["file_path"],
-            f"WER: {result.wer * 100:.1f}%",
-        ] + vis + [""]
-
-        output_str.append("\n".join(vis))
-
-    # Aggregate WER
-    wcount = ncor + nsub + ndel
-    wer = float(nsub + nins + ndel) / wcount if wcount > 0 else 0.0
-    output_str.append("(Average)")
-    output_str.append(f"Word count: {wcount}")
-    output_str.append(f"WER: {wer * 100:.1f}%")
-
     os.makedirs(os.path.dirname(os.path.abspath(args.outputfile)), exist_ok=True)
 
-    with open(args.outputfile, "w") as f:
-        print("\n".join(output_str), file=f)
+    # Write each visualization as it arrives instead of accumulating them all
+    # and joining at the end; only the aggregate counters stay in memory.
+    with open(args.outputfile, "w", buffering=1 << 20) as f:
+        with ProcessPoolExecutor() as ex:
+            for hits, subs, ins, dels, visualizations in ex.map(_score_chunk, chunks):
+                ncor += hits
+                nsub += subs
+                nins += ins
+                ndel += dels
+                for vis in visualizations:
+                    f.write(vis)
+                    f.write("\n")
+
+        # Aggregate WER
+        wcount = ncor + nsub + ndel
+        wer = float(nsub + nins + ndel) / wcount if wcount > 0 else 0.0
+        f.write("(Average)\n")
+        f.write(f"Word count: {wcount}\n")
+        f.write(f"WER: {wer * 100:.1f}%\n")
 
     print(f"WER: {wer * 100:.1f}% ({wcount} words) -> {args.outputfile}")
 
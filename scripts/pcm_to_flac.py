@@ -6,12 +6,25 @@ Audio files are assumed to be 16-bit signed PCM (little-endian), mono, at 16kHz
 """
 
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 
 import numpy as np
 import soundfile as sf
 
 
+def _encode_one(src: Path, output_dir: Path, sample_rate: int) -> str:
+    """Encode a single PCM file to FLAC, returning the output file name."""
+    dst = output_dir / src.with_suffix(".flac").name
+    # Memory-map rather than read_bytes(): the OS pages PCM data in on demand
+    # while libsndfile encodes, instead of materializing the whole file first.
+    audio = np.memmap(src, dtype=np.int16, mode="r")
+    sf.write(str(dst), audio, samplerate=sample_rate, subtype="PCM_16")
+    return dst.name
+
+
 def convert(input_dir: Path, output_dir: Path, sample_rate: int) -> None:
     pcm_files = sorted(input_dir.glob("*.pcm"))
     if not pcm_files:
@@ -20,11 +33,14 @@ def convert(input_dir: Path, output_dir: Path, sample_rate: int) -> None:
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for i, src in enumerate(pcm_files, 1):
-        dst = output_dir / src.with_suffix(".flac").name
-        audio = np.frombuffer(src.read_bytes(), dtype=np.int16)
-        sf.write(str(dst), audio, samplerate=sample_rate, subtype="PCM_16")
-        print(f"[{i}/{len(pcm_files)}] {src.name} -> {dst.name}")
+    # FLAC encoding is CPU-bound and independent per file, so fan out across
+    # all cores; ex.map preserves input order for the progress output.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        results = ex.map(
+            _encode_one, pcm_files, repeat(output_dir), repeat(sample_rate), chunksize=4
+        )
+        for i, (src, dst_name) in enumerate(zip(pcm_files, results, strict=True), 1):
+            print(f"[{i}/{len(pcm_files)}] {src.name} -> {dst_name}")
 
     print(f"\nDone. {len(pcm_files)} files written to {output_dir}")
 
@@ -11,7 +11,12 @@ from stt_benchmark.analysis.statistics import compute_statistics, format_statist
 from stt_benchmark.config import get_config
 from stt_benchmark.models import BenchmarkRun, ServiceName
 from stt_benchmark.pipeline.benchmark_runner import BenchmarkRunner
-from stt_benchmark.services import STT_SERVICES, parse_services_arg
+from stt_benchmark.services import (
+    STT_SERVICES,
+    parse_services_arg,
+    prewarm_imports,
+    prewarm_whisper,
+)
 from stt_benchmark.storage.database import Database
 
 app = typer.Typer()
@@ -82,6 +87,11 @@ def run_benchmark(
             console.print(f"  {config.api_key_env}")
         raise typer.Exit(1)
 
+    # Start loading the providers' pipecat modules while we set up the run
+    prewarm_imports(service_list)
+    if ServiceName.WHISPER in service_list:
+        prewarm_whisper()
+
     console.print(f"Services: {', '.join(s.value for s in service_list)}")
     if model:
         console.print(f"Model override: {model}")
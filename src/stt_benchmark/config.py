@@ -1,5 +1,6 @@
 """Configuration management for STT benchmarking."""
 
+from functools import cache
 from pathlib import Path
 
 from pydantic import Field
@@ -76,8 +77,11 @@ class BenchmarkConfig(BaseSettings):
 
     def ensure_dirs(self) -> None:
         """Create all required directories."""
-        self.data_dir.mkdir(parents=True, exist_ok=True)
+        # audio_dir lives under data_dir by default, so parents=True creates
+        # both in one call; only hit data_dir separately if relocated.
         self.audio_dir.mkdir(parents=True, exist_ok=True)
+        if not self.audio_dir.is_relative_to(self.data_dir):
+            self.data_dir.mkdir(parents=True, exist_ok=True)
 
     @property
     def chunk_size_bytes(self) -> int:
@@ -86,19 +90,12 @@ class BenchmarkConfig(BaseSettings):
         return samples_per_chunk * 2  # 16-bit audio = 2 bytes per sample
 
 
-# Global configuration instance
-_config: BenchmarkConfig | None = None
-
-
+@cache
 def get_config() -> BenchmarkConfig:
     """Get or create the global configuration instance."""
-    global _config
-    if _config is None:
-        _config = BenchmarkConfig()
-    return _config
+    return BenchmarkConfig()
 
 
 def reset_config() -> None:
     """Reset the global configuration (useful for testing)."""
-    global _config
-    _config = None
+    get_config.cache_clear()
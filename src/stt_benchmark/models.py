@@ -1,5 +1,6 @@
 """Data models for STT benchmarking."""
 
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 
@@ -39,39 +40,47 @@ class ServiceName(str, Enum):
     WHISPER = "whisper"
 
 
-class AudioSample(BaseModel):
-    """A single audio sample from the dataset."""
+@dataclass(slots=True, kw_only=True)
+class AudioSample:
+    """A single audio sample from the dataset.
 
-    sample_id: str = Field(description="Unique identifier for the sample")
-    audio_path: str = Field(description="Local path to the PCM audio file")
-    duration_seconds: float = Field(description="Audio duration in seconds")
-    language: str = Field(default="eng", description="Language code")
-    dataset_index: int = Field(description="Original index in HuggingFace dataset")
+    Plain dataclass (not Pydantic) since instances are created per sample in
+    hot paths and need no validation beyond their type annotations.
+    """
 
+    sample_id: str  # Unique identifier for the sample
+    audio_path: str  # Local path to the PCM audio file
+    duration_seconds: float  # Audio duration in seconds
+    language: str = "eng"  # Language code
+    dataset_index: int  # Original index in HuggingFace dataset
 
-class BenchmarkResult(BaseModel):
-    """Result from a single STT benchmark run."""
 
-    sample_id: str = Field(description="Reference to AudioSample.sample_id")
-    service_name: ServiceName = Field(description="STT service used")
-    model_name: str | None = Field(default=None, description="Model name if applicable")
+@dataclass(slots=True, kw_only=True)
+class BenchmarkResult:
+    """Result from a single STT benchmark run.
 
-    # TTFB metrics (from Pipecat's MetricsFrame)
-    ttfb_seconds: float | None = Field(
-        default=None, description="Time to first byte in seconds (from MetricsFrame)"
-    )
+    Plain dataclass (not Pydantic) since one is constructed per sample per
+    service and serialized straight to SQLite.
+    """
 
-    # Transcription result
-    transcription: str | None = Field(default=None, description="Final transcription text")
+    sample_id: str  # Reference to AudioSample.sample_id
+    service_name: ServiceName  # STT service used
+    model_name: str | None = None  # Model name if applicable
 
-    # Audio metadata
-    audio_duration_seconds: float = Field(description="Duration of the audio sample")
+    # TTFB in seconds (from Pipecat's MetricsFrame)
+    ttfb_seconds: float | None = None
+
+    # Final transcription text
+    transcription: str | None = None
+
+    # Duration of the audio sample
+    audio_duration_seconds: float
 
     # Timing
-    timestamp: datetime = Field(default_factory=_utcnow)
+    timestamp: datetime = field(default_factory=_utcnow)
 
-    # Error tracking
-    error: str | None = Field(default=None, description="Error message if failed")
+    # Error message if failed
+    error: str | None = None
 
 
 class AggregateStatistics(BaseModel):
@@ -145,38 +154,34 @@ class SemanticError(BaseModel):
     position: int | None = Field(default=None, description="Position in alignment")
 
 
-class WERMetrics(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class WERMetrics:
     """Semantic Word Error Rate metrics for a transcription.
 
     Uses Claude to evaluate only errors that would impact how an LLM agent
-    understands and responds to the user.
+    understands and responds to the user. Plain dataclass (not Pydantic)
+    since one is constructed per evaluated sample.
     """
 
-    sample_id: str = Field(description="Reference to AudioSample.sample_id")
-    service_name: ServiceName = Field(description="STT service evaluated")
-    model_name: str | None = Field(default=None, description="Model name if applicable")
+    sample_id: str  # Reference to AudioSample.sample_id
+    service_name: ServiceName  # STT service evaluated
+    model_name: str | None = None  # Model name if applicable
 
     # Semantic WER metrics (from Claude evaluation)
-    wer: float = Field(description="Semantic Word Error Rate (0-1+)")
-    substitutions: int = Field(description="Number of semantic substitutions")
-    deletions: int = Field(description="Number of semantic deletions")
-    insertions: int = Field(description="Number of semantic insertions")
-    reference_words: int = Field(description="Total words in normalized reference")
+    wer: float  # Semantic Word Error Rate (0-1+)
+    substitutions: int  # Number of semantic substitutions
+    deletions: int  # Number of semantic deletions
+    insertions: int  # Number of semantic insertions
+    reference_words: int  # Total words in normalized reference
 
-    # Semantic error details
-    errors: list[SemanticError] | None = Field(
-        default=None, description="List of identified semantic errors"
-    )
+    # List of identified semantic errors
+    errors: list[SemanticError] | None = None
 
     # Normalized texts (as determined by Claude)
-    normalized_reference: str | None = Field(
-        default=None, description="Claude-normalized reference text"
-    )
-    normalized_hypothesis: str | None = Field(
-        default=None, description="Claude-normalized hypothesis text"
-    )
+    normalized_reference: str | None = None
+    normalized_hypothesis: str | None = None
 
-    timestamp: datetime = Field(default_factory=_utcnow)
+    timestamp: datetime = field(default_factory=_utcnow)
 
 
 class SemanticWERTrace(BaseModel):
@@ -209,7 +214,10 @@ class SemanticWERTrace(BaseModel):
         default=None, description="Identified semantic errors"
     )
 
-    # Performance metrics
+    # Performance metrics. Stored, not computed: num_turns counts API round
+    # trips (conversation_trace holds several entries per turn, including
+    # tool results) and duration_ms is measured wall-clock by the evaluator,
+    # so neither can be derived from the trace after the fact.
     duration_ms: int | None = Field(default=None, description="Total evaluation time")
     num_turns: int = Field(default=1, description="Number of conversation turns")
     model_used: str = Field(
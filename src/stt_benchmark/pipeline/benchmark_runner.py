@@ -19,7 +19,7 @@ from stt_benchmark.models import AudioSample, BenchmarkResult, ServiceName
 from stt_benchmark.observers.metrics_collector import MetricsCollectorObserver
 from stt_benchmark.observers.transcription_collector import TranscriptionCollectorObserver
 from stt_benchmark.pipeline.synthetic_transport import SyntheticInputTransport
-from stt_benchmark.services import create_stt_service, get_service_definition
+from stt_benchmark.services import build_shared_session, create_stt_service, get_service_definition
 
 
 class BenchmarkRunner:
@@ -60,6 +60,7 @@ class BenchmarkRunner:
         sample: AudioSample,
         service_name: ServiceName,
         model: str | None = None,
+        aiohttp_session: "aiohttp.ClientSession | None" = None,
     ) -> BenchmarkResult:
         """Benchmark a single audio sample with an STT service.
 
@@ -67,6 +68,8 @@ class BenchmarkRunner:
             sample: The audio sample to benchmark.
             service_name: The STT service to use.
             model: Optional model name override.
+            aiohttp_session: Optional shared session for services that need
+                one; if omitted, a session is created per sample.
 
         Returns:
             BenchmarkResult with TTFB and transcription.
@@ -96,9 +99,20 @@ class BenchmarkRunner:
             definition = get_service_definition(service_name.value)
 
             if definition.needs_aiohttp:
-                import aiohttp
+                if aiohttp_session is not None:
+                    # Shared session from the caller: connections are pooled
+                    # across samples, skipping repeat TLS handshakes
+                    return await self._run_pipeline(
+                        sample=sample,
+                        service_name=service_name,
+                        model=model,
+                        audio_data=audio_data,
+                        metrics_observer=metrics_observer,
+                        transcription_observer=transcription_observer,
+                        aiohttp_session=aiohttp_session,
+                    )
 
-                async with aiohttp.ClientSession() as session:
+                async with build_shared_session() as session:
                     return await self._run_pipeline(
                         sample=sample,
                         service_name=service_name,
@@ -268,15 +282,26 @@ class BenchmarkRunner:
         """
         results = []
 
-        for i, sample in enumerate(samples):
-            if progress_callback:
-                progress_callback(i, len(samples), sample.sample_id)
+        # Share one aiohttp session across the whole batch for services that
+        # need one, so repeat requests reuse pooled connections
+        definition = get_service_definition(service_name.value)
+        session = build_shared_session() if definition.needs_aiohttp else None
+
+        try:
+            for i, sample in enumerate(samples):
+                if progress_callback:
+                    progress_callback(i, len(samples), sample.sample_id)
 
-            result = await self.benchmark_sample(sample, service_name, model)
-            results.append(result)
+                result = await self.benchmark_sample(
+                    sample, service_name, model, aiohttp_session=session
+                )
+                results.append(result)
 
-            # Brief delay between samples to avoid rate limiting
-            await asyncio.sleep(0.1)
+                # Brief delay between samples to avoid rate limiting
+                await asyncio.sleep(0.1)
+        finally:
+            if session is not None:
+                await session.close()
 
         if progress_callback:
             progress_callback(len(samples), len(samples), "complete")
@@ -10,7 +10,7 @@ To add a new service or modify an existing one:
 
 Example - modifying Gradium to use a US endpoint:
 
-    def create_gradium() -> FrameProcessor:
+    def create_gradium() -> "FrameProcessor":
         from pipecat.services.gradium.stt import GradiumSTTService
         return GradiumSTTService(
             api_key=_get_env("GRADIUM_API_KEY"),
@@ -18,51 +18,97 @@ Example - modifying Gradium to use a US endpoint:
         )
 """
 
+import asyncio
 import os
-from collections.abc import Callable
-from dataclasses import dataclass, field
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from functools import cache, lru_cache, partial
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
-from pipecat.processors.frame_processor import FrameProcessor
-from pipecat.transcriptions.language import Language
+from loguru import logger
+
+from stt_benchmark.models import ServiceName
+
+# Enum member by value, built once at import: a dict lookup skips the
+# metaclass __call__ that ServiceName(value) goes through on every parse.
+_SERVICE_BY_VALUE: dict[str, ServiceName] = {s.value: s for s in ServiceName}
 
 if TYPE_CHECKING:
     import aiohttp
+    from deepgram import LiveOptions
+    from pipecat.processors.frame_processor import FrameProcessor
+    from pipecat.services.gladia.config import GladiaInputParams
+    from pipecat.services.google.stt import GoogleSTTService
+    from pipecat.services.nvidia.stt import NvidiaSTTService
+    from pipecat.services.soniox.stt import SonioxInputParams
+    from pipecat.services.speechmatics.stt import SpeechmaticsSTTService
 
-    from stt_benchmark.models import ServiceName
+
+# Snapshot of resolved env var values, keyed by env var name. Materialized
+# once on first use so factories and availability checks do a single dict
+# lookup instead of config getattr + os.getenv per call.
+_ENV_CACHE: dict[str, str] = {}
+
+
+def _env_snapshot() -> dict[str, str]:
+    """Build (on first use) the resolved env snapshot.
+
+    The process environment is overlaid with non-empty config values
+    (config loads .env files); unset variables resolve to "".
+    """
+    if not _ENV_CACHE:
+        from stt_benchmark.config import get_config
+
+        config = get_config()
+        _ENV_CACHE.update(os.environ)
+        # Config (which loads .env) takes precedence when it has a value,
+        # matching the old getattr-then-getenv order
+        for attr, value in config.model_dump().items():
+            if isinstance(value, str) and value:
+                _ENV_CACHE[attr.upper()] = value
+    return _ENV_CACHE
+
+
+def _lookup_env(name: str) -> str:
+    """Resolve an env var via config (supports .env files), falling back to os.getenv."""
+    return _env_snapshot().get(name, "")
+
+
+def reset_env_cache() -> None:
+    """Clear cached env lookups (useful for testing, alongside reset_config)."""
+    _ENV_CACHE.clear()
 
 
 def _get_env(name: str) -> str:
     """Get environment variable from config (supports .env files), raising if not set."""
-    from stt_benchmark.config import get_config
-
-    config = get_config()
-    attr_name = name.lower()
-    # Try to get from config first (which loads .env)
-    value = getattr(config, attr_name, None)
-    if value:
-        return value
-    # Fall back to os.getenv for env vars not in config
-    value = os.getenv(name, "")
+    value = _lookup_env(name)
     if not value:
         raise ValueError(f"{name} environment variable not set")
     return value
 
 
-# Type alias for service factory functions
-ServiceFactory = Callable[[], FrameProcessor]
+# Type alias for service factory functions. Pipecat is imported lazily inside
+# each factory so that importing this module (e.g. for CLI --help or scripts
+# that only touch the DB) doesn't pay the full Pipecat/vendor SDK import cost.
+ServiceFactory = Callable[[], "FrameProcessor"]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ServiceDefinition:
-    """Definition of an STT service."""
+    """Definition of an STT service.
+
+    Frozen and slotted: definitions never change after registration, and
+    22 instances live for the whole process.
+    """
 
     # Factory function that creates the configured service instance
     factory: ServiceFactory
 
     # Environment variables required for this service
     # Used to check if service is available before attempting to create it
-    required_env_vars: list[str] = field(default_factory=list)
+    required_env_vars: tuple[str, ...] = ()
 
     # Whether this service requires an aiohttp.ClientSession to be passed
     # to the factory. When True, the pipeline runner will create a session
@@ -75,10 +121,15 @@ class ServiceDefinition:
 # =============================================================================
 # Each factory returns a fully configured Pipecat STT service instance.
 # Modify these to change service configuration (models, endpoints, params, etc.)
+#
+# These stay as explicit functions rather than a declarative spec table on
+# purpose: per-provider quirks (connection params, regions, endpoint URLs,
+# validation workarounds) read better as plain code, and defining the
+# function objects costs microseconds at import.
 # =============================================================================
 
 
-def create_assemblyai() -> FrameProcessor:
+def create_assemblyai() -> "FrameProcessor":
     from pipecat.services.assemblyai.models import AssemblyAIConnectionParams
     from pipecat.services.assemblyai.stt import AssemblyAISTTService
 
@@ -92,16 +143,30 @@ def create_assemblyai() -> FrameProcessor:
     )
 
 
-def create_assemblyai_u3pro_streaming() -> FrameProcessor:
+@lru_cache(maxsize=1)
+def _u3pro_connection_params_cls() -> type:
+    """Connection params with speech_model widened beyond pipecat's Literal.
+
+    "u3-pro" isn't in pipecat's speech_model Literal yet; subclassing with a
+    plain str field lets it validate normally instead of poking __dict__ on
+    every constructed instance (which bypassed __pydantic_fields_set__).
+    Built lazily so importing this module doesn't pull in pipecat.
+    """
     from pipecat.services.assemblyai.models import AssemblyAIConnectionParams
+
+    class _U3ProConnectionParams(AssemblyAIConnectionParams):
+        speech_model: str = "u3-pro"
+
+    return _U3ProConnectionParams
+
+
+def create_assemblyai_u3pro_streaming() -> "FrameProcessor":
     from pipecat.services.assemblyai.stt import AssemblyAISTTService
 
-    params = AssemblyAIConnectionParams(
+    params = _u3pro_connection_params_cls()(
         end_of_turn_confidence_threshold=1.0,
         max_turn_silence=2000,
     )
-    # Bypass Literal validation — "universal-3-pro-streaming" not yet in pipecat's type
-    params.__dict__["speech_model"] = "u3-pro"
 
     return AssemblyAISTTService(
         api_key=_get_env("ASSEMBLYAI_API_PRIVATE_KEY"),
@@ -110,7 +175,7 @@ def create_assemblyai_u3pro_streaming() -> FrameProcessor:
     )
 
 
-def create_aws() -> FrameProcessor:
+def create_aws() -> "FrameProcessor":
     from pipecat.services.aws.stt import AWSTranscribeSTTService
 
     return AWSTranscribeSTTService(
@@ -120,7 +185,7 @@ def create_aws() -> FrameProcessor:
     )
 
 
-def create_azure() -> FrameProcessor:
+def create_azure() -> "FrameProcessor":
     from pipecat.services.azure.stt import AzureSTTService
 
     return AzureSTTService(
@@ -129,7 +194,7 @@ def create_azure() -> FrameProcessor:
     )
 
 
-def create_cartesia() -> FrameProcessor:
+def create_cartesia() -> "FrameProcessor":
     from pipecat.services.cartesia.stt import CartesiaSTTService
 
     return CartesiaSTTService(
@@ -138,23 +203,33 @@ def create_cartesia() -> FrameProcessor:
     )
 
 
-def create_deepgram() -> FrameProcessor:
+@lru_cache(maxsize=1)
+def _deepgram_live_options() -> "LiveOptions":
+    """Build the Deepgram options once; pipecat merges them into its own
+    settings dict at construction, so the instance is safe to share."""
     from deepgram import LiveOptions
+    from pipecat.transcriptions.language import Language
+
+    return LiveOptions(
+        model="nova-3-general",
+        smart_format=False,
+        profanity_filter=False,
+        language=Language.EN,
+    )
+
+
+def create_deepgram() -> "FrameProcessor":
     from pipecat.services.deepgram.stt import DeepgramSTTService
 
     return DeepgramSTTService(
         api_key=_get_env("DEEPGRAM_API_KEY"),
-        live_options=LiveOptions(
-            model="nova-3-general",
-            smart_format=False,
-            profanity_filter=False,
-            language=Language.EN,
-        ),
+        live_options=_deepgram_live_options(),
     )
 
 
-def create_elevenlabs() -> FrameProcessor:
+def create_elevenlabs() -> "FrameProcessor":
     from pipecat.services.elevenlabs.stt import ElevenLabsRealtimeSTTService
+    from pipecat.transcriptions.language import Language
 
     return ElevenLabsRealtimeSTTService(
         api_key=_get_env("ELEVENLABS_API_KEY"),
@@ -165,8 +240,9 @@ def create_elevenlabs() -> FrameProcessor:
     )
 
 
-def create_elevenlabs_http(aiohttp_session: "aiohttp.ClientSession") -> FrameProcessor:
+def create_elevenlabs_http(aiohttp_session: "aiohttp.ClientSession") -> "FrameProcessor":
     from pipecat.services.elevenlabs.stt import ElevenLabsSTTService
+    from pipecat.transcriptions.language import Language
 
     return ElevenLabsSTTService(
         aiohttp_session=aiohttp_session,
@@ -178,8 +254,9 @@ def create_elevenlabs_http(aiohttp_session: "aiohttp.ClientSession") -> FramePro
     )
 
 
-def create_fal() -> FrameProcessor:
+def create_fal() -> "FrameProcessor":
     from pipecat.services.fal.stt import FalSTTService
+    from pipecat.transcriptions.language import Language
 
     return FalSTTService(
         api_key=_get_env("FAL_KEY"),
@@ -189,45 +266,62 @@ def create_fal() -> FrameProcessor:
     )
 
 
-def create_gladia() -> FrameProcessor:
+@lru_cache(maxsize=1)
+def _gladia_params() -> "GladiaInputParams":
+    """Build the nested Gladia config tree (three Pydantic models) once."""
     from pipecat.services.gladia.config import (
         GladiaInputParams,
         LanguageConfig,
         PreProcessingConfig,
     )
+    from pipecat.transcriptions.language import Language
+
+    return GladiaInputParams(
+        language_config=LanguageConfig(
+            languages=[Language.EN],
+        ),
+        endpointing=0.01,
+        pre_processing=PreProcessingConfig(
+            speech_threshold=0.8,
+        ),
+    )
+
+
+def create_gladia() -> "FrameProcessor":
     from pipecat.services.gladia.stt import GladiaSTTService
 
     return GladiaSTTService(
         api_key=_get_env("GLADIA_API_KEY"),
         region=os.getenv("GLADIA_REGION", "us-west"),
         model="solaria-1",
-        params=GladiaInputParams(
-            language_config=LanguageConfig(
-                languages=[Language.EN],
-            ),
-            endpointing=0.01,
-            pre_processing=PreProcessingConfig(
-                speech_threshold=0.8,
-            ),
-        ),
+        params=_gladia_params(),
     )
 
 
-def create_google() -> FrameProcessor:
+@lru_cache(maxsize=1)
+def _google_params() -> "GoogleSTTService.InputParams":
+    from pipecat.services.google.stt import GoogleSTTService
+    from pipecat.transcriptions.language import Language
+
+    return GoogleSTTService.InputParams(
+        languages=Language.EN_US,
+        model="latest_long",
+    )
+
+
+def create_google() -> "FrameProcessor":
     from pipecat.services.google.stt import GoogleSTTService
 
     return GoogleSTTService(
         credentials_path=_get_env("GOOGLE_APPLICATION_CREDENTIALS"),
         location=os.getenv("GOOGLE_LOCATION", "us-central1"),
-        params=GoogleSTTService.InputParams(
-            languages=Language.EN_US,
-            model="latest_long",
-        ),
+        params=_google_params(),
     )
 
 
-def create_gradium() -> FrameProcessor:
+def create_gradium() -> "FrameProcessor":
     from pipecat.services.gradium.stt import GradiumSTTService
+    from pipecat.transcriptions.language import Language
 
     return GradiumSTTService(
         api_key=_get_env("GRADIUM_API_KEY"),
@@ -240,8 +334,9 @@ def create_gradium() -> FrameProcessor:
     )
 
 
-def create_groq() -> FrameProcessor:
+def create_groq() -> "FrameProcessor":
     from pipecat.services.groq.stt import GroqSTTService
+    from pipecat.transcriptions.language import Language
 
     return GroqSTTService(
         api_key=_get_env("GROQ_API_KEY"),
@@ -250,7 +345,7 @@ def create_groq() -> FrameProcessor:
     )
 
 
-def create_hathora() -> FrameProcessor:
+def create_hathora() -> "FrameProcessor":
     from pipecat.services.hathora.stt import HathoraSTTService
 
     return HathoraSTTService(
@@ -259,19 +354,28 @@ def create_hathora() -> FrameProcessor:
     )
 
 
-def create_nvidia() -> FrameProcessor:
+@lru_cache(maxsize=1)
+def _nvidia_params() -> "NvidiaSTTService.InputParams":
+    from pipecat.services.nvidia.stt import NvidiaSTTService
+    from pipecat.transcriptions.language import Language
+
+    return NvidiaSTTService.InputParams(
+        language=Language.EN_US,
+    )
+
+
+def create_nvidia() -> "FrameProcessor":
     from pipecat.services.nvidia.stt import NvidiaSTTService
 
     return NvidiaSTTService(
         api_key=_get_env("NVIDIA_API_KEY"),
-        params=NvidiaSTTService.InputParams(
-            language=Language.EN_US,
-        ),
+        params=_nvidia_params(),
     )
 
 
-def create_openai() -> FrameProcessor:
+def create_openai() -> "FrameProcessor":
     from pipecat.services.openai.stt import OpenAISTTService
+    from pipecat.transcriptions.language import Language
 
     return OpenAISTTService(
         api_key=_get_env("OPENAI_API_KEY"),
@@ -280,8 +384,9 @@ def create_openai() -> FrameProcessor:
     )
 
 
-def create_openai_realtime() -> FrameProcessor:
+def create_openai_realtime() -> "FrameProcessor":
     from pipecat.services.openai.stt import OpenAIRealtimeSTTService
+    from pipecat.transcriptions.language import Language
 
     return OpenAIRealtimeSTTService(
         api_key=_get_env("OPENAI_API_KEY"),
@@ -290,8 +395,9 @@ def create_openai_realtime() -> FrameProcessor:
     )
 
 
-def create_sambanova() -> FrameProcessor:
+def create_sambanova() -> "FrameProcessor":
     from pipecat.services.sambanova.stt import SambaNovaSTTService
+    from pipecat.transcriptions.language import Language
 
     return SambaNovaSTTService(
         api_key=_get_env("SAMBANOVA_API_KEY"),
@@ -300,7 +406,7 @@ def create_sambanova() -> FrameProcessor:
     )
 
 
-def create_sarvam() -> FrameProcessor:
+def create_sarvam() -> "FrameProcessor":
     from pipecat.services.sarvam.stt import SarvamSTTService
 
     return SarvamSTTService(
@@ -309,35 +415,52 @@ def create_sarvam() -> FrameProcessor:
     )
 
 
-def create_soniox() -> FrameProcessor:
-    from pipecat.services.soniox.stt import SonioxInputParams, SonioxSTTService
+@lru_cache(maxsize=1)
+def _soniox_params() -> "SonioxInputParams":
+    from pipecat.services.soniox.stt import SonioxInputParams
+    from pipecat.transcriptions.language import Language
+
+    return SonioxInputParams(
+        model="stt-rt-v4",
+        language_hints=[Language.EN],
+        language_hints_strict=True,
+    )
+
+
+def create_soniox() -> "FrameProcessor":
+    from pipecat.services.soniox.stt import SonioxSTTService
 
     return SonioxSTTService(
         api_key=_get_env("SONIOX_API_KEY"),
-        params=SonioxInputParams(
-            model="stt-rt-v4",
-            language_hints=[Language.EN],
-            language_hints_strict=True,
-        ),
+        params=_soniox_params(),
         vad_force_turn_endpoint=True,
     )
 
 
-def create_speechmatics() -> FrameProcessor:
+@lru_cache(maxsize=1)
+def _speechmatics_params() -> "SpeechmaticsSTTService.InputParams":
     from pipecat.services.speechmatics.stt import SpeechmaticsSTTService, TurnDetectionMode
+    from pipecat.transcriptions.language import Language
+
+    return SpeechmaticsSTTService.InputParams(
+        language=Language.EN,
+        turn_detection_mode=TurnDetectionMode.EXTERNAL,
+    )
+
+
+def create_speechmatics() -> "FrameProcessor":
+    from pipecat.services.speechmatics.stt import SpeechmaticsSTTService
 
     return SpeechmaticsSTTService(
         api_key=_get_env("SPEECHMATICS_API_KEY"),
         base_url=os.getenv("SPEECHMATICS_RT_URL", "wss://us.rt.speechmatics.com/v2"),
-        params=SpeechmaticsSTTService.InputParams(
-            language=Language.EN,
-            turn_detection_mode=TurnDetectionMode.EXTERNAL,
-        ),
+        params=_speechmatics_params(),
     )
 
 
-def create_whisper() -> FrameProcessor:
+def create_whisper() -> "FrameProcessor":
     from pipecat.services.whisper.stt import Model, WhisperSTTService
+    from pipecat.transcriptions.language import Language
 
     return WhisperSTTService(
         model=Model.DISTIL_MEDIUM_EN,
@@ -350,148 +473,252 @@ def create_whisper() -> FrameProcessor:
 # =============================================================================
 # Maps service names to their definitions (factory + required env vars).
 # The required_env_vars are used to check availability before creating.
+#
+# Registering the factories here is cheap: they are plain function objects
+# defined above, and each one imports its pipecat/vendor modules only when
+# invoked. Name listing, parsing, and availability checks never trigger
+# those imports.
 # =============================================================================
 
-STT_SERVICES: dict[str, ServiceDefinition] = {
-    "assemblyai": ServiceDefinition(
-        factory=create_assemblyai,
-        required_env_vars=["ASSEMBLYAI_API_KEY"],
-    ),
-    "assemblyai_u3pro_streaming": ServiceDefinition(
-        factory=create_assemblyai_u3pro_streaming,
-        required_env_vars=["ASSEMBLYAI_API_PRIVATE_KEY"],
-    ),
-    "aws": ServiceDefinition(
-        factory=create_aws,
-        required_env_vars=["AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_REGION"],
-    ),
-    "azure": ServiceDefinition(
-        factory=create_azure,
-        required_env_vars=["AZURE_SPEECH_API_KEY", "AZURE_SPEECH_REGION"],
-    ),
-    "cartesia": ServiceDefinition(
-        factory=create_cartesia,
-        required_env_vars=["CARTESIA_API_KEY"],
-    ),
-    "deepgram": ServiceDefinition(
-        factory=create_deepgram,
-        required_env_vars=["DEEPGRAM_API_KEY"],
-    ),
-    "elevenlabs": ServiceDefinition(
-        factory=create_elevenlabs,
-        required_env_vars=["ELEVENLABS_API_KEY"],
-    ),
-    "elevenlabs_http": ServiceDefinition(
-        factory=create_elevenlabs_http,
-        required_env_vars=["ELEVENLABS_API_KEY"],
-        needs_aiohttp=True,
-    ),
-    "fal": ServiceDefinition(
-        factory=create_fal,
-        required_env_vars=["FAL_KEY"],
-    ),
-    "gladia": ServiceDefinition(
-        factory=create_gladia,
-        required_env_vars=["GLADIA_API_KEY"],
-    ),
-    "google": ServiceDefinition(
-        factory=create_google,
-        required_env_vars=["GOOGLE_APPLICATION_CREDENTIALS"],
-    ),
-    "gradium": ServiceDefinition(
-        factory=create_gradium,
-        required_env_vars=["GRADIUM_API_KEY"],
-    ),
-    "groq": ServiceDefinition(
-        factory=create_groq,
-        required_env_vars=["GROQ_API_KEY"],
-    ),
-    "hathora": ServiceDefinition(
-        factory=create_hathora,
-        required_env_vars=["HATHORA_API_KEY"],
-    ),
-    "nvidia": ServiceDefinition(
-        factory=create_nvidia,
-        required_env_vars=["NVIDIA_API_KEY"],
-    ),
-    "openai": ServiceDefinition(
-        factory=create_openai,
-        required_env_vars=["OPENAI_API_KEY"],
-    ),
-    "openai_realtime": ServiceDefinition(
-        factory=create_openai_realtime,
-        required_env_vars=["OPENAI_API_KEY"],
-    ),
-    "sambanova": ServiceDefinition(
-        factory=create_sambanova,
-        required_env_vars=["SAMBANOVA_API_KEY"],
-    ),
-    "sarvam": ServiceDefinition(
-        factory=create_sarvam,
-        required_env_vars=["SARVAM_API_KEY"],
-    ),
-    "soniox": ServiceDefinition(
-        factory=create_soniox,
-        required_env_vars=["SONIOX_API_KEY"],
-    ),
-    "speechmatics": ServiceDefinition(
-        factory=create_speechmatics,
-        required_env_vars=["SPEECHMATICS_API_KEY"],
-    ),
-    "whisper": ServiceDefinition(
-        factory=create_whisper,
-        required_env_vars=[],  # Local model, no API key needed
-    ),
+# Read-only view: the registry is fixed at import time, and MappingProxyType
+# makes accidental runtime mutation (which would desync the caches below)
+# a TypeError instead of a silent bug.
+STT_SERVICES: MappingProxyType[str, ServiceDefinition] = MappingProxyType(
+    {
+        "assemblyai": ServiceDefinition(
+            factory=create_assemblyai,
+            required_env_vars=("ASSEMBLYAI_API_KEY",),
+        ),
+        "assemblyai_u3pro_streaming": ServiceDefinition(
+            factory=create_assemblyai_u3pro_streaming,
+            required_env_vars=("ASSEMBLYAI_API_PRIVATE_KEY",),
+        ),
+        "aws": ServiceDefinition(
+            factory=create_aws,
+            required_env_vars=("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_REGION"),
+        ),
+        "azure": ServiceDefinition(
+            factory=create_azure,
+            required_env_vars=("AZURE_SPEECH_API_KEY", "AZURE_SPEECH_REGION"),
+        ),
+        "cartesia": ServiceDefinition(
+            factory=create_cartesia,
+            required_env_vars=("CARTESIA_API_KEY",),
+        ),
+        "deepgram": ServiceDefinition(
+            factory=create_deepgram,
+            required_env_vars=("DEEPGRAM_API_KEY",),
+        ),
+        "elevenlabs": ServiceDefinition(
+            factory=create_elevenlabs,
+            required_env_vars=("ELEVENLABS_API_KEY",),
+        ),
+        "elevenlabs_http": ServiceDefinition(
+            factory=create_elevenlabs_http,
+            required_env_vars=("ELEVENLABS_API_KEY",),
+            needs_aiohttp=True,
+        ),
+        "fal": ServiceDefinition(
+            factory=create_fal,
+            required_env_vars=("FAL_KEY",),
+        ),
+        "gladia": ServiceDefinition(
+            factory=create_gladia,
+            required_env_vars=("GLADIA_API_KEY",),
+        ),
+        "google": ServiceDefinition(
+            factory=create_google,
+            required_env_vars=("GOOGLE_APPLICATION_CREDENTIALS",),
+        ),
+        "gradium": ServiceDefinition(
+            factory=create_gradium,
+            required_env_vars=("GRADIUM_API_KEY",),
+        ),
+        "groq": ServiceDefinition(
+            factory=create_groq,
+            required_env_vars=("GROQ_API_KEY",),
+        ),
+        "hathora": ServiceDefinition(
+            factory=create_hathora,
+            required_env_vars=("HATHORA_API_KEY",),
+        ),
+        "nvidia": ServiceDefinition(
+            factory=create_nvidia,
+            required_env_vars=("NVIDIA_API_KEY",),
+        ),
+        "openai": ServiceDefinition(
+            factory=create_openai,
+            required_env_vars=("OPENAI_API_KEY",),
+        ),
+        "openai_realtime": ServiceDefinition(
+            factory=create_openai_realtime,
+            required_env_vars=("OPENAI_API_KEY",),
+        ),
+        "sambanova": ServiceDefinition(
+            factory=create_sambanova,
+            required_env_vars=("SAMBANOVA_API_KEY",),
+        ),
+        "sarvam": ServiceDefinition(
+            factory=create_sarvam,
+            required_env_vars=("SARVAM_API_KEY",),
+        ),
+        "soniox": ServiceDefinition(
+            factory=create_soniox,
+            required_env_vars=("SONIOX_API_KEY",),
+        ),
+        "speechmatics": ServiceDefinition(
+            factory=create_speechmatics,
+            required_env_vars=("SPEECHMATICS_API_KEY",),
+        ),
+        "whisper": ServiceDefinition(
+            factory=create_whisper,
+            required_env_vars=(),  # Local model, no API key needed
+        ),
+    }
+)
+
+# Service names in registration order, snapshotted once so listing them
+# doesn't rebuild a list from the mapping on every call. The joined form
+# feeds unknown-service error messages without re-joining per error.
+_ALL_NAMES: tuple[str, ...] = tuple(STT_SERVICES)
+_ALL_NAMES_STR: str = ", ".join(_ALL_NAMES)
+
+
+# Pipecat/vendor modules each factory imports when invoked, used to prewarm
+# imports in the background before a benchmark run touches them.
+_SERVICE_MODULES: dict[str, tuple[str, ...]] = {
+    "assemblyai": ("pipecat.services.assemblyai.stt",),
+    "assemblyai_u3pro_streaming": ("pipecat.services.assemblyai.stt",),
+    "aws": ("pipecat.services.aws.stt",),
+    "azure": ("pipecat.services.azure.stt",),
+    "cartesia": ("pipecat.services.cartesia.stt",),
+    "deepgram": ("deepgram", "pipecat.services.deepgram.stt"),
+    "elevenlabs": ("pipecat.services.elevenlabs.stt",),
+    "elevenlabs_http": ("pipecat.services.elevenlabs.stt",),
+    "fal": ("pipecat.services.fal.stt",),
+    "gladia": ("pipecat.services.gladia.config", "pipecat.services.gladia.stt"),
+    "google": ("pipecat.services.google.stt",),
+    "gradium": ("pipecat.services.gradium.stt",),
+    "groq": ("pipecat.services.groq.stt",),
+    "hathora": ("pipecat.services.hathora.stt",),
+    "nvidia": ("pipecat.services.nvidia.stt",),
+    "openai": ("pipecat.services.openai.stt",),
+    "openai_realtime": ("pipecat.services.openai.stt",),
+    "sambanova": ("pipecat.services.sambanova.stt",),
+    "sarvam": ("pipecat.services.sarvam.stt",),
+    "soniox": ("pipecat.services.soniox.stt",),
+    "speechmatics": ("pipecat.services.speechmatics.stt",),
+    "whisper": ("pipecat.services.whisper.stt",),
 }
 
 
+def prewarm_whisper() -> None:
+    """Warm the local Whisper model in a background thread.
+
+    Constructing WhisperSTTService downloads the model on first use and
+    reads hundreds of MB of weights from disk. Pipecat processors are
+    single-use (one per pipeline), so the instance itself can't be shared
+    across samples — but building one throwaway instance early pulls the
+    download into the HuggingFace cache and the weights into the OS page
+    cache, so the first real sample's construction is a warm re-read
+    instead of a cold download.
+    """
+
+    def _load() -> None:
+        try:
+            STT_SERVICES["whisper"].factory()
+        except Exception as e:
+            logger.warning(f"Whisper prewarm failed: {e}")
+
+    threading.Thread(target=_load, name="whisper-prewarm", daemon=True).start()
+
+
+def prewarm_imports(service_names: list[ServiceName]) -> None:
+    """Import the pipecat submodules for the given services in the background.
+
+    Each provider's first import costs ~100-300 ms of disk and bytecode
+    load; starting them on background threads overlaps that I/O with other
+    startup work. Python's import lock makes this safe — a factory invoked
+    before its module finishes loading simply waits for it.
+    """
+    import importlib
+    from concurrent.futures import ThreadPoolExecutor
+
+    modules = {module for name in service_names for module in _SERVICE_MODULES.get(name.value, ())}
+    executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="import-prewarm")
+    for module in sorted(modules):
+        executor.submit(importlib.import_module, module)
+    executor.shutdown(wait=False)
+
+
 # =============================================================================
 # SERVICE CREATION & AVAILABILITY
 # =============================================================================
 
 
+@cache
 def get_service_definition(name: str) -> ServiceDefinition:
-    """Get the service definition by name."""
+    """Get the service definition by name.
+
+    Memoized: STT_SERVICES is immutable after import, so repeated lookups
+    (one per benchmarked sample) resolve from the cache.
+    """
     if name not in STT_SERVICES:
-        raise ValueError(f"Unknown service: {name}. Available: {list(STT_SERVICES.keys())}")
+        raise ValueError(f"Unknown service: {name}. Available: {_ALL_NAMES_STR}")
     return STT_SERVICES[name]
 
 
 def get_all_service_names() -> list[str]:
     """Get all configured service names."""
-    return list(STT_SERVICES.keys())
+    return list(_ALL_NAMES)
 
 
 def _get_env_from_config(env_var_name: str) -> str:
     """Get environment variable value from config (supports .env files via Pydantic).
 
     Derives config attribute from env var name: DEEPGRAM_API_KEY -> deepgram_api_key
-    Falls back to os.getenv() for env vars not in config.
+    Falls back to os.getenv() for env vars not in config. Returns "" if unset.
     """
-    from stt_benchmark.config import get_config
+    return _lookup_env(env_var_name)
+
+
+# Availability of each service, computed once per process. Env vars don't
+# change under a running benchmark, so the scan over required_env_vars is
+# done a single time for all services.
+_AVAILABILITY: dict[str, bool] | None = None
+
+
+def _availability() -> dict[str, bool]:
+    """Get (computing on first use) the name -> available map for all services."""
+    global _AVAILABILITY
+    if _AVAILABILITY is None:
+        # One subset test per service against the set of env vars with
+        # non-empty values, instead of resolving each required var in turn
+        set_keys = frozenset(key for key, value in _env_snapshot().items() if value)
+        _AVAILABILITY = {
+            name: set_keys.issuperset(definition.required_env_vars)
+            for name, definition in STT_SERVICES.items()
+        }
+    return _AVAILABILITY
 
-    config = get_config()
-    attr_name = env_var_name.lower()
-    # Try to get from config first (which loads .env)
-    value = getattr(config, attr_name, None)
-    if value is not None:
-        return value
-    # Fall back to os.getenv for env vars not in config
-    return os.getenv(env_var_name, "")
+
+def invalidate_availability_cache() -> None:
+    """Recompute availability on next check (for tests that mutate the env)."""
+    global _AVAILABILITY
+    _AVAILABILITY = None
+    _available_cached.cache_clear()
+    reset_env_cache()
 
 
 def is_service_available(name: str) -> bool:
     """Check if a service has all required environment variables set."""
-    if name not in STT_SERVICES:
-        return False
-    definition = STT_SERVICES[name]
-    return all(_get_env_from_config(env_var) for env_var in definition.required_env_vars)
+    return _availability().get(name, False)
 
 
 def create_stt_service(
-    service_name: "ServiceName",
+    service_name: ServiceName,
     aiohttp_session: "aiohttp.ClientSession | None" = None,
-) -> FrameProcessor:
+) -> "FrameProcessor":
     """Create an STT service instance using its factory function.
 
     Args:
@@ -505,8 +732,6 @@ def create_stt_service(
     Raises:
         ValueError: If service_name is not supported or required credentials are missing.
     """
-    from loguru import logger
-
     definition = get_service_definition(service_name.value)
     logger.debug(f"Creating {service_name.value} STT service")
 
@@ -521,40 +746,105 @@ def create_stt_service(
     return definition.factory()
 
 
-def get_available_services() -> list["ServiceName"]:
-    """Get list of services that have all required credentials configured.
+def build_shared_session() -> "aiohttp.ClientSession":
+    """Build an aiohttp session tuned for reuse across benchmark samples.
+
+    Keep-alive and per-host connection limits let repeated requests to the
+    same provider skip TCP/TLS handshakes; DNS results are cached for 5
+    minutes. The caller owns the session and must close it.
+    """
+    import aiohttp
+
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=128,
+            limit_per_host=16,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        )
+    )
+
+
+async def create_stt_services(
+    service_names: list[ServiceName],
+    aiohttp_session: "aiohttp.ClientSession | None" = None,
+) -> dict[ServiceName, "FrameProcessor"]:
+    """Create multiple STT services concurrently.
+
+    Factory calls block on vendor imports and client setup, so they are
+    dispatched to the default executor and awaited together — wall-clock
+    init is bounded by the slowest provider rather than the sum of all.
+    Services that need an aiohttp session (needs_aiohttp=True) all share
+    the one passed in, built via build_shared_session, so connection pools
+    and DNS caches are amortized across them. Services that fail to
+    construct are logged and omitted from the result.
+
+    The returned instances are not memoized: Pipecat processors are
+    single-use, one per pipeline run.
+
+    Args:
+        service_names: The STT services to create.
+        aiohttp_session: Optional shared aiohttp session for services that
+            require one.
 
     Returns:
-        List of ServiceName values for available services.
+        Mapping of ServiceName to constructed service, for services that
+        initialized successfully.
     """
-    from loguru import logger
+    loop = asyncio.get_running_loop()
+    tasks = [
+        loop.run_in_executor(None, partial(create_stt_service, name, aiohttp_session))
+        for name in service_names
+    ]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    services: dict[ServiceName, FrameProcessor] = {}
+    for name, result in zip(service_names, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.warning(f"Failed to create {name.value}: {result}")
+        else:
+            services[name] = result
+    return services
 
-    from stt_benchmark.models import ServiceName
 
+def get_available_services() -> list[ServiceName]:
+    """Get list of services that have all required credentials configured.
+
+    Returns:
+        List of ServiceName values for available services.
+    """
     available = []
-    for name in STT_SERVICES:
-        if is_service_available(name):
-            try:
-                available.append(ServiceName(name))
-            except ValueError:
-                logger.warning(f"Service {name} not in ServiceName enum")
+    unavailable: dict[str, tuple[str, ...]] = {}
+    for name, is_available in _availability().items():
+        if not is_available:
+            unavailable[name] = STT_SERVICES[name].required_env_vars
+            continue
+        service = _SERVICE_BY_VALUE.get(name)
+        if service is None:
+            logger.warning("Service {} not in ServiceName enum", name)
         else:
-            definition = STT_SERVICES[name]
-            logger.debug(
-                f"Service {name} not available (missing env vars: {definition.required_env_vars})"
-            )
+            available.append(service)
+
+    if unavailable:
+        # One aggregate line with deferred formatting instead of a debug
+        # f-string per unavailable service
+        logger.debug("Services unavailable (required env vars): {}", unavailable)
+
     return available
 
 
-def get_all_services() -> list["ServiceName"]:
-    """Get list of all supported services.
+# All enum members, snapshotted once; callers that need a mutable list can
+# copy with list(get_all_services()).
+_ALL_SERVICE_NAMES: tuple[ServiceName, ...] = tuple(ServiceName)
+
+
+def get_all_services() -> Sequence[ServiceName]:
+    """Get all supported services.
 
     Returns:
-        List of all ServiceName values.
+        Immutable sequence of all ServiceName values.
     """
-    from stt_benchmark.models import ServiceName
-
-    return list(ServiceName)
+    return _ALL_SERVICE_NAMES
 
 
 # =============================================================================
@@ -562,7 +852,7 @@ def get_all_services() -> list["ServiceName"]:
 # =============================================================================
 
 
-def parse_service_name(name: str) -> "ServiceName":
+def parse_service_name(name: str) -> ServiceName:
     """Parse a service name string to ServiceName enum.
 
     Args:
@@ -574,15 +864,23 @@ def parse_service_name(name: str) -> "ServiceName":
     Raises:
         ValueError: If service name is unknown
     """
-    from stt_benchmark.models import ServiceName
+    try:
+        return _SERVICE_BY_VALUE[name.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Unknown service: {name}. Available: {_ALL_NAMES_STR}") from None
+
 
-    name_lower = name.strip().lower()
-    if name_lower not in STT_SERVICES:
-        raise ValueError(f"Unknown service: {name}. Available: {', '.join(STT_SERVICES.keys())}")
-    return ServiceName(name_lower)
+@lru_cache(maxsize=1)
+def _available_cached() -> tuple[ServiceName, ...]:
+    """Available services as an immutable tuple, computed once per process.
+
+    Cleared by invalidate_availability_cache alongside the underlying
+    availability map.
+    """
+    return tuple(get_available_services())
 
 
-def parse_services_arg(services_arg: str) -> list["ServiceName"]:
+def parse_services_arg(services_arg: str) -> list[ServiceName]:
     """Parse a comma-separated services argument.
 
     Args:
@@ -592,6 +890,6 @@ def parse_services_arg(services_arg: str) -> list["ServiceName"]:
         List of ServiceName enum values
     """
     if services_arg.lower() == "all":
-        return get_available_services()
+        return list(_available_cached())
 
     return [parse_service_name(s) for s in services_arg.split(",")]
@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import aiosqlite
+import orjson
 from loguru import logger
 
 from stt_benchmark.config import get_config
@@ -19,6 +20,10 @@ from stt_benchmark.models import (
     WERMetrics,
 )
 
+# Prebuilt value -> member map so row converters skip the enum __call__
+# machinery when deserializing thousands of rows.
+_SERVICE_BY_VALUE: dict[str, ServiceName] = {s.value: s for s in ServiceName}
+
 
 class Database:
     """SQLite database for storing benchmark results."""
@@ -404,7 +409,7 @@ class Database:
         """Convert a database row to a BenchmarkResult."""
         return BenchmarkResult(
             sample_id=row["sample_id"],
-            service_name=ServiceName(row["service_name"]),
+            service_name=_SERVICE_BY_VALUE[row["service_name"]],
             model_name=row["model_name"],
             ttfb_seconds=row["ttfb_seconds"],
             transcription=row["transcription"],
@@ -688,7 +693,7 @@ class Database:
 
         return WERMetrics(
             sample_id=row["sample_id"],
-            service_name=ServiceName(row["service_name"]),
+            service_name=_SERVICE_BY_VALUE[row["service_name"]],
             model_name=row["model_name"] or None,
             wer=row["wer"],
             substitutions=row["substitutions"],
@@ -724,8 +729,10 @@ class Database:
                 trace.service_name.value,
                 model_name,
                 trace.session_id,
-                json.dumps(trace.conversation_trace),
-                json.dumps(trace.tool_calls),
+                # conversation traces can be large; orjson encodes them much
+                # faster than stdlib json (stored as TEXT for compatibility)
+                orjson.dumps(trace.conversation_trace).decode(),
+                orjson.dumps(trace.tool_calls).decode(),
                 trace.normalized_reference,
                 trace.normalized_hypothesis,
                 trace.wer,
@@ -766,11 +773,11 @@ class Database:
 
         return SemanticWERTrace(
             sample_id=row["sample_id"],
-            service_name=ServiceName(row["service_name"]),
+            service_name=_SERVICE_BY_VALUE[row["service_name"]],
             model_name=row["model_name"] or None,
             session_id=row["session_id"],
-            conversation_trace=json.loads(row["conversation_trace"]),
-            tool_calls=json.loads(row["tool_calls"]),
+            conversation_trace=orjson.loads(row["conversation_trace"]),
+            tool_calls=orjson.loads(row["tool_calls"]),
             normalized_reference=row["normalized_reference"],
             normalized_hypothesis=row["normalized_hypothesis"],
             wer=row["wer"],
@@ -852,13 +859,12 @@ class Database:
         rows = await cursor.fetchall()
         result = []
         for row in rows:
-            try:
-                service = ServiceName(row["service_name"])
-                model = row["model_name"] if row["model_name"] else None
-                result.append((service, model))
-            except ValueError:
+            service = _SERVICE_BY_VALUE.get(row["service_name"])
+            if service is None:
                 # Skip unknown services
                 continue
+            model = row["model_name"] if row["model_name"] else None
+            result.append((service, model))
         return result
 
     async def get_service_transcript_stats(
@@ -941,13 +947,12 @@ class Database:
         rows = await cursor.fetchall()
         result = []
         for row in rows:
-            try:
-                service = ServiceName(row["service_name"])
-                model = row["model_name"] if row["model_name"] else None
-                result.append((service, model))
-            except ValueError:
+            service = _SERVICE_BY_VALUE.get(row["service_name"])
+            if service is None:
                 # Skip unknown services
                 continue
+            model = row["model_name"] if row["model_name"] else None
+            result.append((service, model))
         return result
 
     async def get_service_summary(